@@ -26,7 +26,6 @@ import time
 import json
 from version import BUILD_NUMBER  # Import the BUILD_NUMBER
 from app_utils import log_job_status, discover_and_register_blueprints  # Import the discover_and_register_blueprints function
-from services.gcp_toolkit import trigger_cloud_run_job
 
 MAX_QUEUE_LENGTH = int(os.environ.get('MAX_QUEUE_LENGTH', 0))
 
@@ -187,6 +186,7 @@ def create_app():
                         }
 
                         # Call trigger_cloud_run_job with the overrides dictionary
+                        from services.gcp_toolkit import trigger_cloud_run_job
                         response = trigger_cloud_run_job(
                             job_name=os.environ.get("GCP_JOB_NAME"),
                             location=os.environ.get("GCP_JOB_LOCATION", "us-central1"),
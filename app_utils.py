@@ -21,9 +21,20 @@ from functools import wraps
 import jsonschema
 import os
 import json
+import tempfile
 import time
 from config import LOCAL_STORAGE_PATH
 
+# Directory holding one status file per job, created once at startup
+JOBS_DIR = os.path.join(LOCAL_STORAGE_PATH, 'jobs')
+os.makedirs(JOBS_DIR, exist_ok=True)
+
+# Mode for job status files, matching what open() would create under the process umask.
+# os.umask can only be read by setting it, so do it once at import before any threads start.
+_umask = os.umask(0)
+os.umask(_umask)
+JOB_FILE_MODE = 0o666 & ~_umask
+
 def validate_payload(schema):
     def decorator(f):
         @wraps(f)
@@ -54,18 +65,25 @@ def log_job_status(job_id, data):
         job_id (str): The unique job ID
         data (dict): Data to write to the log file
     """
-    jobs_dir = os.path.join(LOCAL_STORAGE_PATH, 'jobs')
-    
-    # Create jobs directory if it doesn't exist
-    if not os.path.exists(jobs_dir):
-        os.makedirs(jobs_dir, exist_ok=True)
-    
     # Create or update the job log file
-    job_file = os.path.join(jobs_dir, f"{job_id}.json")
+    job_file = os.path.join(JOBS_DIR, f"{job_id}.json")
     
-    # Write data directly to file
-    with open(job_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Write to a temp file and rename it into place, so readers never see a partially written status.
+    # Recreate the jobs directory if it was removed since startup.
+    try:
+        f = tempfile.NamedTemporaryFile('w', dir=JOBS_DIR, suffix='.tmp', delete=False)
+    except FileNotFoundError:
+        os.makedirs(JOBS_DIR, exist_ok=True)
+        f = tempfile.NamedTemporaryFile('w', dir=JOBS_DIR, suffix='.tmp', delete=False)
+    try:
+        with f:
+            json.dump(data, f, indent=2)
+        # NamedTemporaryFile creates files as 0600; keep the usual umask-based permissions
+        os.chmod(f.name, JOB_FILE_MODE)
+        os.replace(f.name, job_file)
+    except Exception:
+        os.remove(f.name)
+        raise
 
 def queue_task_wrapper(bypass_queue=False):
     def decorator(f):
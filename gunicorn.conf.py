@@ -109,6 +109,18 @@ def cloud_run_job_task():
         os._exit(0)
 
 
+def post_worker_init(worker):
+    """Hook called after a worker has loaded the application."""
+    if os.environ.get("WHISPER_WARMUP", "true").lower() == "true":
+        # A warm-up problem must never stop the worker from booting
+        try:
+            import threading
+            from services.v1.media.media_transcribe import warm_model
+            threading.Thread(target=warm_model, daemon=True).start()
+        except Exception as e:
+            worker.log.warning(f"Skipping Whisper warm-up: {e}")
+
+
 def when_ready(server):
     """Hook called when Gunicorn server is ready."""
     if os.environ.get("CLOUD_RUN_JOB"):
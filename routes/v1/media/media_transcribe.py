@@ -19,10 +19,10 @@
 from flask import Blueprint
 from app_utils import *
 import logging
-import os
+from concurrent.futures import ThreadPoolExecutor
 from services.v1.media.media_transcribe import process_transcribe_media
 from services.authentication import authenticate
-from services.cloud_storage import upload_file
+from services.cloud_storage import upload_bytes
 
 v1_media_transcribe_bp = Blueprint('v1_media_transcribe', __name__)
 logger = logging.getLogger(__name__)
@@ -67,7 +67,7 @@ def transcribe(job_id, data):
         result = process_transcribe_media(media_url, task, include_text, include_srt, include_segments, word_timestamps, response_type, language, job_id, words_per_line)
         logger.info(f"Job {job_id}: Transcription process completed successfully")
 
-        # If the result is a file path, upload it using the unified upload_file() method
+        # Direct responses return the outputs inline; cloud responses upload the in-memory payloads with upload_bytes()
         if response_type == "direct":
            
             result_json = {
@@ -83,24 +83,29 @@ def transcribe(job_id, data):
 
         else:
 
+            # Upload the requested outputs concurrently, straight from memory
+            outputs = {
+                "text": (result[0], f"{job_id}.txt", "text/plain; charset=utf-8"),
+                "srt": (result[1], f"{job_id}.srt", "application/x-subrip; charset=utf-8"),
+                "segments": (result[2], f"{job_id}.json", "application/json"),
+            }
+            uploads = [(kind, output) for kind, output in outputs.items() if output[0] is not None]
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                urls = dict(zip(
+                    [kind for kind, _ in uploads],
+                    executor.map(lambda upload: upload_bytes(*upload[1]), uploads)
+                ))
+
             cloud_urls = {
                 "text": None,
                 "srt": None,
                 "segments": None,
-                "text_url": upload_file(result[0]) if include_text is True else None,
-                "srt_url": upload_file(result[1]) if include_srt is True else None,
-                "segments_url": upload_file(result[2]) if include_segments is True else None,
+                "text_url": urls.get("text"),
+                "srt_url": urls.get("srt"),
+                "segments_url": urls.get("segments"),
             }
 
-            if include_text is True:
-                os.remove(result[0])  # Remove the temporary file after uploading
-            
-            if include_srt is True:
-                os.remove(result[1])
-
-            if include_segments is True:
-                os.remove(result[2])
-            
             return cloud_urls, "/v1/transcribe/media", 200
 
     except Exception as e:
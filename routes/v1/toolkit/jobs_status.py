@@ -64,22 +64,20 @@ def get_all_jobs_status(job_id, data):
         jobs_status = {}
         
         # Iterate through job files in the directory
-        for filename in os.listdir(jobs_dir):
-            if filename.endswith('.json'):
-                job_file_path = os.path.join(jobs_dir, filename)
-                file_mod_time = os.path.getmtime(job_file_path)
-                
-                # Check if the file was modified within the time range
-                if file_mod_time >= cutoff_time:
-                    job_id = filename.split('.')[0]  # Remove .json extension to get job_id
-                    
-                    # Read the job status file
-                    with open(job_file_path, 'r') as file:
-                        job_data = json.load(file)
+        with os.scandir(jobs_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+                    # Check if the file was modified within the time range
+                    if entry.stat().st_mtime >= cutoff_time:
+                        job_id = entry.name.split('.')[0]  # Remove .json extension to get job_id
                         
-                        # Only include the job_status field, not the response
-                        if "job_status" in job_data:
-                            jobs_status[job_id] = job_data["job_status"]
+                        # Read the job status file
+                        with open(entry.path, 'r') as file:
+                            job_data = json.load(file)
+                            
+                            # Only include the job_status field, not the response
+                            if "job_status" in job_data:
+                                jobs_status[job_id] = job_data["job_status"]
         
         # Return the job statuses
         return jobs_status, endpoint, 200
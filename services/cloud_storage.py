@@ -18,14 +18,17 @@
 
 import os
 import logging
+import threading
 from abc import ABC, abstractmethod
-from services.gcp_toolkit import upload_to_gcs
-from services.s3_toolkit import upload_to_s3
 from config import validate_env_vars
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Storage provider shared by all uploads in this process, built on first use
+_provider = None
+_provider_lock = threading.Lock()
+
 def parse_s3_url(s3_url):
     """Parse S3 URL to extract bucket name, region, and endpoint URL."""
     parsed_url = urlparse(s3_url)
@@ -43,13 +46,23 @@ class CloudStorageProvider(ABC):
     def upload_file(self, file_path: str) -> str:
         pass
 
+    @abstractmethod
+    def upload_bytes(self, data: bytes, key: str, content_type: str) -> str:
+        pass
+
 class GCPStorageProvider(CloudStorageProvider):
     def __init__(self):
         self.bucket_name = os.getenv('GCP_BUCKET_NAME')
 
+    # The GCP SDK is only imported once a GCP provider is actually used
     def upload_file(self, file_path: str) -> str:
+        from services.gcp_toolkit import upload_to_gcs
         return upload_to_gcs(file_path, self.bucket_name)
 
+    def upload_bytes(self, data: bytes, key: str, content_type: str) -> str:
+        from services.gcp_toolkit import upload_bytes_to_gcs
+        return upload_bytes_to_gcs(data, key, content_type, self.bucket_name)
+
 class S3CompatibleProvider(CloudStorageProvider):
     def __init__(self):
 
@@ -58,6 +71,8 @@ class S3CompatibleProvider(CloudStorageProvider):
         self.secret_key = os.getenv('S3_SECRET_KEY')
         self.bucket_name = os.environ.get('S3_BUCKET_NAME', '')
         self.region = os.environ.get('S3_REGION', '')
+        # Canned ACL applied to uploaded objects; set S3_ACL to an empty value to send none
+        self.acl = os.environ.get('S3_ACL', 'public-read')
         
         # Check if endpoint is Digital Ocean and bucket name or region is missing
         if (self.endpoint_url and 
@@ -83,10 +98,16 @@ class S3CompatibleProvider(CloudStorageProvider):
             except Exception as e:
                 logger.warning(f"Failed to parse Digital Ocean URL: {e}. Using provided values.")
 
+    # boto3 is only imported once an S3 provider is actually used
     def upload_file(self, file_path: str) -> str:
-        return upload_to_s3(file_path, self.endpoint_url, self.access_key, self.secret_key, self.bucket_name, self.region)
+        from services.s3_toolkit import upload_to_s3
+        return upload_to_s3(file_path, self.endpoint_url, self.access_key, self.secret_key, self.bucket_name, self.region, self.acl)
 
-def get_storage_provider() -> CloudStorageProvider:
+    def upload_bytes(self, data: bytes, key: str, content_type: str) -> str:
+        from services.s3_toolkit import upload_bytes_to_s3
+        return upload_bytes_to_s3(data, key, content_type, self.endpoint_url, self.access_key, self.secret_key, self.bucket_name, self.region, self.acl)
+
+def _create_storage_provider() -> CloudStorageProvider:
     
     if os.getenv('S3_ENDPOINT_URL'):
 
@@ -105,6 +126,21 @@ def get_storage_provider() -> CloudStorageProvider:
     
     raise ValueError(f"No cloud storage settings provided.")
 
+def get_storage_provider() -> CloudStorageProvider:
+    """Return the configured storage provider, creating it on first call."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = _create_storage_provider()
+    return _provider
+
+def reset_storage_provider():
+    """Drop the cached provider so the next upload re-reads the environment."""
+    global _provider
+    with _provider_lock:
+        _provider = None
+
 def upload_file(file_path: str) -> str:
     provider = get_storage_provider()
     try:
@@ -115,4 +151,15 @@ def upload_file(file_path: str) -> str:
     except Exception as e:
         logger.error(f"Error uploading file to cloud storage: {e}")
         raise
-    
\ No newline at end of file
+
+def upload_bytes(data: bytes, key: str, content_type: str) -> str:
+    """Upload in-memory data to cloud storage without writing it to disk first."""
+    provider = get_storage_provider()
+    try:
+        logger.info(f"Uploading data to cloud storage: {key}")
+        url = provider.upload_bytes(data, key, content_type)
+        logger.info(f"Data uploaded successfully: {url}")
+        return url
+    except Exception as e:
+        logger.error(f"Error uploading data to cloud storage: {e}")
+        raise
@@ -17,16 +17,27 @@
 
 
 import os
+import shutil
 import uuid
 import requests
 from urllib.parse import urlparse, parse_qs
 import mimetypes
+from http.cookiejar import DefaultCookiePolicy
 
-def get_extension_from_url(url):
+# Shared session so downloads from the same host reuse pooled TCP/TLS connections.
+# Cookies are not persisted, so one job's download never sends cookies set during another's.
+_session = requests.Session()
+_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=16))
+_session.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=16))
+
+def get_extension_from_url(url, content_type=None):
     """Extract file extension from URL or content type.
     
     Args:
         url (str): The URL to extract the extension from
+        content_type (str, optional): Content-Type header of the response, used
+            when the URL path has no extension
         
     Returns:
         str: The file extension including the dot (e.g., '.jpg')
@@ -43,14 +54,10 @@ def get_extension_from_url(url):
             return ext
 
     # If no extension in URL, try to determine from content type
-    try:
-        response = requests.head(url, allow_redirects=True)
-        content_type = response.headers.get('content-type', '').split(';')[0]
-        ext = mimetypes.guess_extension(content_type)
+    if content_type:
+        ext = mimetypes.guess_extension(content_type.split(';')[0].strip())
         if ext:
             return ext.lower()
-    except:
-        pass
 
     # If we can't determine the extension, raise an error
     raise ValueError(f"Could not determine file extension from URL: {url}")
@@ -61,21 +68,22 @@ def download_file(url, storage_path="/tmp/"):
     os.makedirs(storage_path, exist_ok=True)
     
     file_id = str(uuid.uuid4())
-    extension = get_extension_from_url(url)
-    local_filename = os.path.join(storage_path, f"{file_id}{extension}")
+    local_filename = None
 
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        with _session.get(url, stream=True, timeout=(5, 300)) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
 
-        with open(local_filename, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            # Resolve the extension from the GET response rather than a separate HEAD request
+            extension = get_extension_from_url(url, response.headers.get('content-type'))
+            local_filename = os.path.join(storage_path, f"{file_id}{extension}")
+
+            with open(local_filename, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
         return local_filename
     except Exception as e:
-        if os.path.exists(local_filename):
+        if local_filename and os.path.exists(local_filename):
             os.remove(local_filename)
         raise e
-
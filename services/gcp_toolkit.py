@@ -72,6 +72,21 @@ def upload_to_gcs(file_path, bucket_name=GCP_BUCKET_NAME):
         logger.error(f"Error uploading file to GCS: {e}")
         raise
 
+def upload_bytes_to_gcs(data, key, content_type, bucket_name=GCP_BUCKET_NAME):
+    if not gcs_client:
+        raise ValueError("GCS client is not initialized. Skipping upload.")
+
+    try:
+        logger.info(f"Uploading data to Google Cloud Storage: {key}")
+        bucket = gcs_client.bucket(bucket_name)
+        blob = bucket.blob(key)
+        blob.upload_from_string(data, content_type=content_type)
+        logger.info(f"Data uploaded successfully to GCS: {blob.public_url}")
+        return blob.public_url
+    except Exception as e:
+        logger.error(f"Error uploading data to GCS: {e}")
+        raise
+
 
 def trigger_cloud_run_job(job_name, location="us-central1", overrides=None):
     # Retrieve service account credentials
@@ -19,26 +19,55 @@
 import os
 import boto3
 import logging
+import threading
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from urllib.parse import urlparse, quote
 
 logger = logging.getLogger(__name__)
 
-def upload_to_s3(file_path, s3_url, access_key, secret_key, bucket_name, region):
+# S3 clients keyed by (endpoint_url, access_key, region); the secret is never part of the key
+_s3_clients = {}
+_s3_clients_lock = threading.Lock()
+
+_S3_CLIENT_CONFIG = Config(max_pool_connections=32)
+
+# Large files are uploaded as multipart transfers with parts sent in parallel
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+def _get_s3_client(endpoint_url, access_key, secret_key, region):
+    """Return a cached S3 client for the given endpoint and credentials."""
+    key = (endpoint_url, access_key, region)
+    client = _s3_clients.get(key)
+    if client is None:
+        with _s3_clients_lock:
+            client = _s3_clients.get(key)
+            if client is None:
+                session = boto3.session.Session(
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key,
+                    region_name=region
+                )
+                client = session.client('s3', endpoint_url=endpoint_url, config=_S3_CLIENT_CONFIG)
+                _s3_clients[key] = client
+    return client
+
+def upload_to_s3(file_path, s3_url, access_key, secret_key, bucket_name, region, acl=None):
     # Parse the S3 URL into bucket, region, and endpoint
     #bucket_name, region, endpoint_url = parse_s3_url(s3_url)
     
-    session = boto3.Session(
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        region_name=region
-    )
-    
-    client = session.client('s3', endpoint_url=s3_url)
+    client = _get_s3_client(s3_url, access_key, secret_key, region)
 
     try:
         # Upload the file to the specified S3 bucket
-        with open(file_path, 'rb') as data:
-            client.upload_fileobj(data, bucket_name, os.path.basename(file_path), ExtraArgs={'ACL': 'public-read'})
+        # Only send an ACL when one is configured; buckets with ACLs disabled reject it
+        extra_args = {'ACL': acl} if acl else {}
+        client.upload_file(file_path, bucket_name, os.path.basename(file_path), ExtraArgs=extra_args, Config=_TRANSFER_CONFIG)
 
         # URL encode the filename for the URL
         encoded_filename = quote(os.path.basename(file_path))
@@ -47,3 +76,18 @@ def upload_to_s3(file_path, s3_url, access_key, secret_key, bucket_name, region)
     except Exception as e:
         logger.error(f"Error uploading file to S3: {e}")
         raise
+
+def upload_bytes_to_s3(data, key, content_type, s3_url, access_key, secret_key, bucket_name, region, acl=None):
+    """Upload in-memory data to S3 under the given key with a single put_object call."""
+    client = _get_s3_client(s3_url, access_key, secret_key, region)
+
+    try:
+        extra_args = {'ACL': acl} if acl else {}
+        client.put_object(Bucket=bucket_name, Key=key, Body=data, ContentType=content_type, **extra_args)
+
+        # URL encode the key for the URL
+        file_url = f"{s3_url}/{bucket_name}/{quote(key)}"
+        return file_url
+    except Exception as e:
+        logger.error(f"Error uploading data to S3: {e}")
+        raise
@@ -18,8 +18,6 @@ import os
 import logging
 import requests
 import json
-from google.cloud import storage
-from google.oauth2 import service_account
 from urllib.parse import urlparse, unquote
 import uuid
 
@@ -31,6 +29,10 @@ def get_gcs_client():
     if not credentials_json:
         raise ValueError("GCP_SA_CREDENTIALS environment variable is not set")
     
+    # Imported here so the GCP SDK is only loaded when this endpoint is used
+    from google.cloud import storage
+    from google.oauth2 import service_account
+
     try:
         # Parse the JSON credentials
         credentials_info = json.loads(credentials_json)
@@ -10,7 +10,6 @@ def get_feedback_path():
     static_dir = os.path.join(base_dir, 'static')
     
     # Create the directory if it doesn't exist
-    if not os.path.exists(static_dir):
-        os.makedirs(static_dir)
+    os.makedirs(static_dir, exist_ok=True)
     
     return static_dir
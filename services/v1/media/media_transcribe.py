@@ -17,10 +17,12 @@
 
 
 import os
+import threading
+import numpy as np
+import orjson
+import psutil
+import torch
 import whisper
-import srt
-from datetime import timedelta
-from whisper.utils import WriteSRT, WriteVTT
 from services.file_management import download_file
 import logging
 from config import LOCAL_STORAGE_PATH
@@ -29,8 +31,120 @@ from config import LOCAL_STORAGE_PATH
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Loaded Whisper models, shared across requests in this worker process
+_MODEL_CACHE = {}
+_MODEL_LOCK = threading.Lock()
+
+# Whisper installs per-call KV-cache and word-timestamp hooks on the model, so a shared
+# model must not decode concurrently (e.g. a queued job alongside a direct request)
+_TRANSCRIBE_LOCK = threading.Lock()
+
+# Pick the device once; half precision is only used where the hardware supports it.
+# On CPU whisper always decodes in FP32, so requesting FP16 there only triggers a warning.
+_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+_FP16 = _DEVICE == "cuda"
+
+def _cpu_threads():
+    """Return the number of intra-op threads for CPU inference.
+
+    Uses WHISPER_CPU_THREADS when set to a valid integer, otherwise the smaller of the
+    CPUs in this process's affinity mask and the host's physical core count.
+    """
+    configured = os.environ.get('WHISPER_CPU_THREADS')
+    if configured:
+        try:
+            return max(1, int(configured))
+        except ValueError:
+            logger.warning(f"Ignoring invalid WHISPER_CPU_THREADS value: {configured!r}")
+
+    available = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+    physical = psutil.cpu_count(logical=False) or available
+    return max(1, min(physical, available))
+
+# One model copy per worker, with at most one intra-op thread per physical core
+if _DEVICE == "cpu":
+    torch.set_num_threads(_cpu_threads())
+
+def _get_model(model_size, device=_DEVICE):
+    """Return a cached Whisper model, loading it on first use."""
+    key = (model_size, device)
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        with _MODEL_LOCK:
+            model = _MODEL_CACHE.get(key)
+            if model is None:
+                model = whisper.load_model(model_size, device=device)
+                _MODEL_CACHE[key] = model
+                logger.info(f"Loaded Whisper {model_size} model")
+    return model
+
+def warm_model(model_size="base"):
+    """Load the Whisper model and run a short silent transcription so the first request starts warm."""
+    try:
+        model = _get_model(model_size)
+        silence = np.zeros(whisper.audio.SAMPLE_RATE // 2, dtype=np.float32)
+        with _TRANSCRIBE_LOCK:
+            model.transcribe(silence, temperature=0, condition_on_previous_text=False, verbose=None, fp16=_FP16)
+        logger.info(f"Warmed up Whisper {model_size} model")
+    except Exception as e:
+        logger.warning(f"Whisper warm-up failed: {e}")
+
+def _fmt_ts_ms(total_ms):
+    """Format a time in whole milliseconds as an SRT timestamp (HH:MM:SS,mmm)."""
+    h, rem = divmod(total_ms, 3_600_000)
+    m, rem = divmod(rem, 60_000)
+    s, ms = divmod(rem, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+def _compose_srt(entries):
+    """Compose SRT text from (start, end, text) tuples.
+
+    Entries with empty text or a non-positive duration are dropped, as srt.compose does.
+    """
+    blocks = []
+    index = 1
+    for start, end, text in entries:
+        if not text or start < 0 or start >= end:
+            continue
+        start_ms = int(start * 1000 + 0.5)
+        end_ms = int(end * 1000 + 0.5)
+        blocks.append(f"{index}\n{_fmt_ts_ms(start_ms)} --> {_fmt_ts_ms(end_ms)}\n{text}\n\n")
+        index += 1
+    return "".join(blocks)
+
+def _iter_word_chunks(segments, words_per_line):
+    """Yield (start, end, text) subtitles of words_per_line words in a single pass over segments.
+
+    Each segment's duration is spread evenly over its words; chunks may span segments.
+    """
+    chunk = []
+    chunk_start = chunk_end = 0
+    for segment in segments:
+        words = segment['text'].strip().split()
+        if not words:
+            continue
+
+        segment_start = segment['start']
+        duration_per_word = (segment['end'] - segment_start) / len(words)
+        for i, word in enumerate(words):
+            word_start = segment_start + (i * duration_per_word)
+            if not chunk:
+                chunk_start = word_start
+            chunk.append(word)
+            chunk_end = word_start + duration_per_word
+
+            if len(chunk) == words_per_line:
+                yield chunk_start, chunk_end, ' '.join(chunk)
+                chunk = []
+
+    if chunk:
+        yield chunk_start, chunk_end, ' '.join(chunk)
+
 def process_transcribe_media(media_url, task, include_text, include_srt, include_segments, word_timestamps, response_type, language, job_id, words_per_line=None):
-    """Transcribe or translate media and return the transcript/translation, SRT or VTT file path."""
+    """Transcribe or translate media and return the transcript/translation, SRT and segments.
+
+    Direct responses return the values as-is; cloud responses return them encoded as bytes, ready to upload.
+    """
     logger.info(f"Starting {task} for media URL: {media_url}")
     input_filename = download_file(media_url, os.path.join(LOCAL_STORAGE_PATH, f"{job_id}_input"))
     logger.info(f"Downloaded media to local file: {input_filename}")
@@ -39,21 +153,22 @@ def process_transcribe_media(media_url, task, include_text, include_srt, include
         # Load a larger model for better translation quality
         #model_size = "large" if task == "translate" else "base"
         model_size = "base"
-        model = whisper.load_model(model_size)
-        logger.info(f"Loaded Whisper {model_size} model")
+        model = _get_model(model_size)
 
         # Configure transcription/translation options
         options = {
             "task": task,
             "word_timestamps": word_timestamps,
-            "verbose": False
+            "verbose": False,
+            "fp16": _FP16
         }
 
         # Add language specification if provided
         if language:
             options["language"] = language
 
-        result = model.transcribe(input_filename, **options)
+        with _TRANSCRIBE_LOCK:
+            result = model.transcribe(input_filename, **options)
         
         # For translation task, the result['text'] will be in English
         text = None
@@ -63,60 +178,20 @@ def process_transcribe_media(media_url, task, include_text, include_srt, include
         logger.info(f"Generated {task} output")
 
         if include_text is True:
-            text = result['text']
+            # Whisper already joins the segment texts; only the leading space needs stripping
+            text = result['text'].strip()
 
         if include_srt is True:
-            srt_subtitles = []
-            subtitle_index = 1
-            
             if words_per_line and words_per_line > 0:
-                # Collect all words and their timings
-                all_words = []
-                word_timings = []
-                
-                for segment in result['segments']:
-                    words = segment['text'].strip().split()
-                    segment_start = segment['start']
-                    segment_end = segment['end']
-                    
-                    # Calculate timing for each word
-                    if words:
-                        duration_per_word = (segment_end - segment_start) / len(words)
-                        for i, word in enumerate(words):
-                            word_start = segment_start + (i * duration_per_word)
-                            word_end = word_start + duration_per_word
-                            all_words.append(word)
-                            word_timings.append((word_start, word_end))
-                
-                # Process words in chunks of words_per_line
-                current_word = 0
-                while current_word < len(all_words):
-                    # Get the next chunk of words
-                    chunk = all_words[current_word:current_word + words_per_line]
-                    
-                    # Calculate timing for this chunk
-                    chunk_start = word_timings[current_word][0]
-                    chunk_end = word_timings[min(current_word + len(chunk) - 1, len(word_timings) - 1)][1]
-                    
-                    # Create the subtitle
-                    srt_subtitles.append(srt.Subtitle(
-                        subtitle_index,
-                        timedelta(seconds=chunk_start),
-                        timedelta(seconds=chunk_end),
-                        ' '.join(chunk)
-                    ))
-                    subtitle_index += 1
-                    current_word += words_per_line
+                srt_entries = _iter_word_chunks(result['segments'], words_per_line)
             else:
                 # Original behavior - one subtitle per segment
-                for segment in result['segments']:
-                    start = timedelta(seconds=segment['start'])
-                    end = timedelta(seconds=segment['end'])
-                    segment_text = segment['text'].strip()
-                    srt_subtitles.append(srt.Subtitle(subtitle_index, start, end, segment_text))
-                    subtitle_index += 1
+                srt_entries = (
+                    (segment['start'], segment['end'], segment['text'].strip())
+                    for segment in result['segments']
+                )
             
-            srt_text = srt.compose(srt_subtitles)
+            srt_text = _compose_srt(srt_entries)
 
         if include_segments is True:
             segments_json = result['segments']
@@ -127,30 +202,13 @@ def process_transcribe_media(media_url, task, include_text, include_srt, include
 
         if response_type == "direct":
             return text, srt_text, segments_json
-        else:
-            
-            if include_text is True:
-                text_filename = os.path.join(LOCAL_STORAGE_PATH, f"{job_id}.txt")
-                with open(text_filename, 'w') as f:
-                    f.write(text)
-            else:
-                text_file = None
-            
-            if include_srt is True:
-                srt_filename = os.path.join(LOCAL_STORAGE_PATH, f"{job_id}.srt")
-                with open(srt_filename, 'w') as f:
-                    f.write(srt_text)
-            else:
-                srt_filename = None
-
-            if include_segments is True:
-                segments_filename = os.path.join(LOCAL_STORAGE_PATH, f"{job_id}.json")
-                with open(segments_filename, 'w') as f:
-                    f.write(str(segments_json))
-            else:
-                segments_filename = None
 
-            return text_filename, srt_filename, segments_filename 
+        # Cloud responses are uploaded straight from memory, so return encoded payloads
+        return (
+            text.encode('utf-8') if text is not None else None,
+            srt_text.encode('utf-8') if srt_text is not None else None,
+            orjson.dumps(segments_json, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY) if segments_json is not None else None
+        )
 
     except Exception as e:
         logger.error(f"{task.capitalize()} failed: {str(e)}")
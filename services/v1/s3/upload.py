@@ -17,7 +17,6 @@
 
 
 import os
-import boto3
 import logging
 import requests
 from urllib.parse import urlparse, unquote, quote
@@ -33,6 +32,8 @@ def get_s3_client():
     secret_key = os.getenv('S3_SECRET_KEY')
     region = os.environ.get('S3_REGION', '')
     
+    # Imported here so boto3 is only loaded when this endpoint is used
+    import boto3
     session = boto3.Session(
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,